@@ -15,27 +15,44 @@ Usage:
 Attributes:
     HOST (str): The hostname for the local server (default: 'localhost').
     PORT (int): The port number for the local server (default: 8050).
+    DEBUG (bool): Runs Dash in debug mode with the reloader when the
+        DASH_DEBUG environment variable is set to '1' (default: off).
+    DATA_FILE (str): Path to the student dataset (default: 'student-mat.csv').
+    CACHE_DIR (str): Directory for the on-disk model and figure cache
+        (default: '.cache').
 
 Dependencies:
     - dash: For building the web application.
     - plotly: For generating interactive figures.
     - pandas: For data manipulation.
+    - joblib: For caching the trained model and figures on disk.
+    - diskcache: For the background grade calculator callback and its cache.
+    - flask: For the server Dash runs on, configured for gzip responses.
     - main: Local module containing ML logic (prepare_data, train_model, etc.).
 """
 #%%
+import hashlib
+import os
 import webbrowser
 from threading import Timer
 from typing import List, Dict, Any, Tuple
 
 import dash
-from dash import html, dcc, Input, Output, State
+import diskcache
+import flask
+from dash import html, dcc, Input, Output, State, DiskcacheManager
+from dash.exceptions import PreventUpdate
 import plotly.express as px
+import pandas as pd
 import plotly.io as pio
+from joblib import Memory
 
 # Local application imports
+import main
 from main import (
     prepare_data,
     train_model,
+    build_predictor,
     predict_grade,
     load_and_clean,
     accuracy_fig,
@@ -48,6 +65,12 @@ from main import (
 pio.renderers.default = 'browser'
 HOST: str = 'localhost'
 PORT: int = 8050
+DEBUG: bool = os.environ.get('DASH_DEBUG', '0') == '1'
+DATA_FILE: str = 'student-mat.csv'
+CACHE_DIR: str = '.cache'
+
+# On-disk cache for the trained model and static figures
+memory = Memory(location=CACHE_DIR, verbose=0)
 
 
 def open_browser(host: str = 'localhost', port: int = 8050) -> None:
@@ -62,24 +85,101 @@ def open_browser(host: str = 'localhost', port: int = 8050) -> None:
     """
     webbrowser.open_new(f'http://{host}:{port}')
 
+
+def _source_digest(*paths: str) -> str:
+    """Returns a SHA-256 hex digest over the contents of the given files.
+
+    Args:
+        *paths (str): Paths of the files to hash, in order.
+
+    Returns:
+        str: The combined hex digest.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _predictor_digest(predictor: Tuple[Any, ...], *paths: str) -> str:
+    """Returns a SHA-256 hex digest identifying a fitted predictor.
+
+    Covers the folded weights, bias and column order from `build_predictor`,
+    plus the contents of the given source files.
+
+    Args:
+        predictor (Tuple[Any, ...]): The (weights, bias, col_index) tuple.
+        *paths (str): Paths of the source files on the prediction path.
+
+    Returns:
+        str: The combined hex digest.
+    """
+    weights, bias, col_index = predictor
+    digest = hashlib.sha256(weights.tobytes())
+    digest.update(repr((bias, tuple(col_index))).encode())
+    digest.update(_source_digest(*paths).encode())
+    return digest.hexdigest()
+
 #%%
 # --- Data Loading and Model Training ---
 
-# Load dataset
-df = load_and_clean('student-mat.csv')
+@memory.cache
+def _build_dashboard_data(source_digest: str, filename: str, threshold: float) -> Tuple[Any, ...]:
+    """Loads the data, trains the model and builds the static dashboard figures.
+
+    The result is deterministic for a given dataset and pipeline code, so it
+    is cached on disk by joblib and reused across server restarts.
 
-# Prepare features and target variables
-# Split ratio: 0.06 is used for testing in this specific configuration
-X_train, X_test, y_train, y_test, selected_features, scaler = prepare_data('student-mat.csv', 0.06)
+    Args:
+        source_digest (str): Hash of the dataset and `main` module source. Only
+            used as part of the cache key, so edits to either invalidate it.
+        filename (str): Path to the source CSV file.
+        threshold (float): Correlation threshold for feature selection.
+
+    Returns:
+        tuple: The cleaned dataframe, the train/test splits, the selected
+        features, the fitted scaler and model, the evaluation metrics and
+        predictions, and the four static figures as plain dicts.
+    """
+    # Load dataset
+    df = load_and_clean(filename)
+
+    # Prepare features and target variables
+    # Split ratio: 0.06 is used for testing in this specific configuration
+    X_train, X_test, y_train, y_test, selected_features, scaler = prepare_data(df, threshold)
+
+    # Train the Linear Regression model
+    lin_reg, error, r2, y_test, y_pred = train_model(X_train, X_test, y_train, y_test)
+
+    # Generate static figures for the dashboard
+    # Stored as plain dicts so Dash does not re-serialize the Figure objects on every page load
+    figures = (
+        accuracy_fig(y_test, y_pred).to_dict(),
+        grade_fig(df).to_dict(),
+        feature_fig(X_train, lin_reg).to_dict(),
+        heatmap_fig(threshold, selected_features, df).to_dict(),
+    )
 
-# Train the Linear Regression model
-lin_reg, error, r2, y_test, y_pred = train_model(X_train, X_test, y_train, y_test)
+    return (df, X_train, X_test, y_train, y_test, selected_features, scaler,
+            lin_reg, error, r2, y_pred, figures)
 
-# Generate static figures for the dashboard
-fig_model_accuracy = accuracy_fig(y_test, y_pred)
-fig_g3_dist = grade_fig(df)
-fig_features = feature_fig(X_train, lin_reg)
-fig_correlation = heatmap_fig(0.06,selected_features, df)
+
+SOURCE_DIGEST: str = _source_digest(DATA_FILE, main.__file__)
+
+(df, X_train, X_test, y_train, y_test, selected_features, scaler,
+ lin_reg, error, r2, y_pred, figures) = _build_dashboard_data(SOURCE_DIGEST, DATA_FILE, 0.06)
+fig_model_accuracy, fig_g3_dist, fig_features, fig_correlation = figures
+
+# Freeze the training column order once instead of reading X_train.columns per prediction
+FEATURE_COLUMNS: Tuple[str, ...] = tuple(X_train.columns)
+
+# Scaler folded into the model weights, plus the column positions, for single-row predictions
+PREDICTOR = build_predictor(lin_reg, scaler, FEATURE_COLUMNS)
+
+# Identifies the served model for the calculator's result cache, so a retrained model
+# (e.g. a new threshold) or edited prediction code never reuses old grades
+PREDICTOR_DIGEST: str = _predictor_digest(PREDICTOR, __file__, main.__file__)
 
 #%%
 # --- Constants and Mappings ---
@@ -132,28 +232,49 @@ feature_map: Dict[str, str] = {
     'Fjob': "Father's Job",
     'reason': "Reason for School Choice"
 }
+
+# Display label for every dataframe column, falling back to the raw column name
+LABELS: Dict[str, str] = {col: feature_map.get(col, col) for col in df.columns}
 #%%
 # Calculate statistics for display
+# (label, column, invert): inverted columns report the share of 0s instead of 1s
+stats_spec: List[Tuple[str, str, bool]] = [
+    (feature_map['sex'] + " (Male)", 'sex', False),
+    (feature_map['school'] + " (Gabriel Pereira)", 'school', True),
+    (feature_map['address'] + " (Urban)", 'address', True),
+    (feature_map['higher'], 'higher', False),
+    (feature_map['internet'], 'internet', False),
+    (feature_map['romantic'], 'romantic', False),
+    (feature_map['activities'], 'activities', False),
+    (feature_map['Pstatus'], 'Pstatus', False),
+    (feature_map['famsize'] + " Bigger than 3", 'famsize', False),
+    (feature_map['famsup'], 'famsup', False),
+    (feature_map['paid'], 'paid', False)
+]
+bool_cols: List[str] = [col for _, col, _ in stats_spec]
+
+# One NumPy aggregation over all binary columns instead of a pandas .mean() per column
+means: Dict[str, float] = dict(zip(bool_cols, df[bool_cols].to_numpy().mean(axis=0).tolist()))
 stats_data: List[Tuple[str, float]] = [
-    (feature_map['sex'] + " (Male)", df['sex'].mean() * 100),
-    (feature_map['school'] + " (Gabriel Pereira)", (1 - df['school'].mean()) * 100),
-    (feature_map['address'] + " (Urban)", (1 - df['address'].mean()) * 100),
-    (feature_map['higher'], df['higher'].mean() * 100),
-    (feature_map['internet'], df['internet'].mean() * 100),
-    (feature_map['romantic'], df['romantic'].mean() * 100),
-    (feature_map['activities'], df['activities'].mean() * 100),
-    (feature_map['Pstatus'], df['Pstatus'].mean() * 100),
-    (feature_map['famsize'] + " Bigger than 3", df['famsize'].mean() * 100),
-    (feature_map['famsup'], df['famsup'].mean() * 100),
-    (feature_map['paid'], df['paid'].mean() * 100)
+    (label, ((1 - means[col]) if invert else means[col]) * 100)
+    for label, col, invert in stats_spec
+]
+
+# Build the list items once, so they are not recreated if the layout becomes a function
+stats_items = [
+    html.Li([
+        html.Strong(f"{label}: "), f"{value:.1f}%"
+    ], style={'marginBottom': '8px', 'fontSize': '16px'})
+    for label, value in stats_data
 ]
 #%%
 # Identify excluded features for the "Excluded Features" list
 all_columns = [col for col in df.columns if col != 'G3']
-excluded_features = [col for col in all_columns if col not in selected_features]
+selected_set = set(selected_features)
+excluded_features = [col for col in all_columns if col not in selected_set]
 list_items = [
     html.Li(
-        feature_map.get(col, col), 
+        LABELS[col],
         style={'marginBottom': '10px'}
     ) 
     for col in excluded_features
@@ -165,7 +286,33 @@ eda_variables = [
     'sex', 'address', 'school', 'failures', 'Medu',
     'Walc', 'Dalc', 'goout', 'studytime', 'higher', 'internet'
 ]
-eda_options = [{'label': feature_map.get(var, var), 'value': var} for var in eda_variables]
+eda_options = [{'label': LABELS[var], 'value': var} for var in eda_variables]
+
+# Readable labels for the binary EDA variables, indexed by their 0/1 code
+CAT_MAPS: Dict[str, pd.CategoricalDtype] = {
+    'sex': pd.CategoricalDtype(['Female', 'Male']),
+    'address': pd.CategoricalDtype(['Urban', 'Rural']),
+    'school': pd.CategoricalDtype(['Gabriel Pereira', 'Mousinho da Silveira']),
+    'internet': pd.CategoricalDtype(['No', 'Yes']),
+    'higher': pd.CategoricalDtype(['No', 'Yes'])
+}
+
+#%%
+# Dropdown options for the grade calculator, shared between inputs with the same choices
+Options = List[Dict[str, Any]]
+
+YES_NO: Options = [{'label': 'No', 'value': 0}, {'label': 'Yes', 'value': 1}]
+SCHOOL_OPTS: Options = [{'label': 'Gabriel Pereira', 'value': 0}, {'label': 'Mousinho da Silveira', 'value': 1}]
+SEX_OPTS: Options = [{'label': 'Female', 'value': 0}, {'label': 'Male', 'value': 1}]
+ADDRESS_OPTS: Options = [{'label': 'Urban', 'value': 0}, {'label': 'Rural', 'value': 1}]
+AGE_OPTS: Options = [{'label': str(i), 'value': i} for i in range(15, 23)]
+RANGE_0_4: Options = [{'label': str(i), 'value': i} for i in range(0, 5)]
+LIKERT_1_5: Options = [{'label': str(i), 'value': i} for i in range(1, 6)]
+ABSENCES_OPTS: Options = [{'label': str(i), 'value': i} for i in range(0, 31)]
+JOB_OPTS: Options = [{'label': 'At Home', 'value': 'at_home'}, {'label': 'Health Care', 'value': 'health'}, {'label': 'Other', 'value': 'other'}, {'label': 'Civil Services', 'value': 'services'}, {'label': 'Teacher', 'value': 'teacher'}]
+REASON_OPTS: Options = [{'label': 'Close to Home', 'value': 'home'}, {'label': 'Reputation', 'value': 'reputation'}, {'label': 'Course Preference', 'value': 'course'}, {'label': 'Other', 'value': 'other'}]
+STUDYTIME_OPTS: Options = [{'label': 'Low (<2h)', 'value': 1}, {'label': 'Moderate', 'value': 1}, {'label': 'High', 'value': 3}, {'label': 'Very High (>10h)', 'value': 4}]
+TRAVELTIME_OPTS: Options = [{'label': '<15 min', 'value': 1}, {'label': '15-30 min', 'value': 1}, {'label': '30-60 min', 'value': 3}, {'label': '>1 hour', 'value': 4}]
 
 
 #%%# --- Helper Functions ---
@@ -188,10 +335,66 @@ def create_input_group(label_text: str, d_id: str, d_options: List[Dict[str, Any
         dcc.Dropdown(id=d_id, options=d_options, value=d_value)
     ], style={'marginBottom': '20px'})
 
+
+def _build_box(selected_variable: str) -> Any:
+    """Builds the EDA box plot for a single variable.
+
+    Copies only the two plotted columns, maps the raw categorical or binary
+    values to human-readable labels (e.g., 0/1 to Female/Male), and generates
+    a Box Plot comparing the selected feature to the final grade (G3).
+
+    Args:
+        selected_variable (str): The column name to plot against G3.
+
+    Returns:
+        plotly.graph_objects.Figure: A Plotly Box plot figure visualization.
+    """
+    plot_df = df[[selected_variable, 'G3']].copy()
+    nice_name = LABELS[selected_variable]
+
+    # Map raw 0/1 codes to readable labels for specific binary columns
+    if selected_variable in CAT_MAPS:
+        plot_df[selected_variable] = pd.Categorical.from_codes(
+            plot_df[selected_variable].to_numpy(),
+            dtype=CAT_MAPS[selected_variable]
+        )
+
+    # Create the visualization
+    fig = px.box(
+        plot_df,
+        x=selected_variable,
+        y='G3',
+        color=selected_variable,
+        title=f"Impact of '{nice_name}' on Final Grade",
+        labels={selected_variable: nice_name, 'G3': 'Final Grade (0-100)'}
+    )
+
+    return fig
+
+#%%
+# The EDA dropdown has a fixed set of values, so every figure is built once up front
+EDA_FIGS: Dict[str, Dict[str, Any]] = {var: _build_box(var).to_dict() for var in eda_variables}
+
 #%%
 # --- Dash Application Layout ---
 
-app = dash.Dash(__name__)
+# Background callbacks run in a worker process; results are memoized on disk per
+# set of inputs and invalidated whenever the served model or prediction code changes
+background_callback_manager = DiskcacheManager(
+    diskcache.Cache(os.path.join(CACHE_DIR, 'callbacks')),
+    cache_by=[lambda: PREDICTOR_DIGEST]
+)
+
+# gzip responses; the precomputed figure JSON compresses very well. Flask-Compress
+# reads its settings when Dash sets it up, so the server is configured up front
+server = flask.Flask(__name__)
+server.config['COMPRESS_ALGORITHM'] = 'gzip'
+app = dash.Dash(
+    __name__,
+    server=server,
+    compress=True,
+    background_callback_manager=background_callback_manager
+)
 
 app.layout = html.Div(
     style={
@@ -223,14 +426,7 @@ app.layout = html.Div(
             html.Div([
                 html.H3('Dataset Statistics', style={'borderBottom': '2px solid green', 'paddingBottom': '10px'}),
                 html.P("Overview of the data averages:"),
-                html.Ul(
-                    children=[
-                        html.Li([
-                            html.Strong(f"{label}: "), f"{value:.1f}%"
-                        ], style={'marginBottom': '8px', 'fontSize': '16px'})
-                        for label, value in stats_data
-                    ],
-                )
+                html.Ul(children=stats_items)
             ], style={'marginBottom': '50px'}),
             
             html.H3("Correlation Heatmap", style={'marginTop': '30px','borderBottom': '2px solid green', 'paddingBottom': '10px'}),
@@ -269,35 +465,35 @@ app.layout = html.Div(
                 html.Div([
                     html.H3("Student & Family", style={'fontSize': '20px', 'color': 'green', 'borderBottom': '2px solid green', 'paddingBottom': '10px', 'marginBottom': '20px'}),
 
-                    create_input_group(feature_map['school'], 'school', [{'label': 'Gabriel Pereira', 'value': 0}, {'label': 'Mousinho da Silveira', 'value': 1}], 0),
-                    create_input_group(feature_map['sex'], 'sex', [{'label': 'Female', 'value': 0}, {'label': 'Male', 'value': 1}], 0),
-                    create_input_group(feature_map['age'], 'age', [{'label': str(i), 'value': i} for i in range(15, 23)], 18),
-                    create_input_group(feature_map['address'], 'address', [{'label': 'Urban', 'value': 0}, {'label': 'Rural', 'value': 1}], 0),
-                    create_input_group(feature_map['internet'], 'internet', [{'label': 'No', 'value': 0}, {'label': 'Yes', 'value': 1}], 1),
-                    create_input_group(feature_map['romantic'], 'romantic', [{'label': 'No', 'value': 0}, {'label': 'Yes', 'value': 1}], 0),
-                    create_input_group(feature_map['Medu'], 'Medu', [{'label': str(i), 'value': i} for i in range(0, 5)], 0),
-                    create_input_group(feature_map['Fedu'], 'Fedu', [{'label': str(i), 'value': i} for i in range(0, 5)], 0),
-                    create_input_group(feature_map['Mjob'], 'Mjob', [{'label': 'At Home', 'value': 'at_home'}, {'label': 'Health Care', 'value': 'health'}, {'label': 'Other', 'value': 'other'}, {'label': 'Civil Services', 'value': 'services'}, {'label': 'Teacher', 'value': 'teacher'}], 'other'),
-                    create_input_group(feature_map['Fjob'], 'Fjob', [{'label': 'At Home', 'value': 'at_home'}, {'label': 'Health Care', 'value': 'health'}, {'label': 'Other', 'value': 'other'}, {'label': 'Civil Services', 'value': 'services'}, {'label': 'Teacher', 'value': 'teacher'}], 'other'),
-                    create_input_group(feature_map['reason'], 'reason', [{'label': 'Close to Home', 'value': 'home'}, {'label': 'Reputation', 'value': 'reputation'}, {'label': 'Course Preference', 'value': 'course'}, {'label': 'Other', 'value': 'other'}], 'course'),
+                    create_input_group(feature_map['school'], 'school', SCHOOL_OPTS, 0),
+                    create_input_group(feature_map['sex'], 'sex', SEX_OPTS, 0),
+                    create_input_group(feature_map['age'], 'age', AGE_OPTS, 18),
+                    create_input_group(feature_map['address'], 'address', ADDRESS_OPTS, 0),
+                    create_input_group(feature_map['internet'], 'internet', YES_NO, 1),
+                    create_input_group(feature_map['romantic'], 'romantic', YES_NO, 0),
+                    create_input_group(feature_map['Medu'], 'Medu', RANGE_0_4, 0),
+                    create_input_group(feature_map['Fedu'], 'Fedu', RANGE_0_4, 0),
+                    create_input_group(feature_map['Mjob'], 'Mjob', JOB_OPTS, 'other'),
+                    create_input_group(feature_map['Fjob'], 'Fjob', JOB_OPTS, 'other'),
+                    create_input_group(feature_map['reason'], 'reason', REASON_OPTS, 'course'),
 
                 ], style={'flex': 1, 'padding': '20px', 'minWidth': '300px', 'backgroundColor': '#f9f9f9', 'borderRadius': '10px'}),
 
                 html.Div([
                     html.H3("Academic & Lifestyle", style={'fontSize': '20px', 'color': 'green', 'borderBottom': '2px solid green', 'paddingBottom': '10px', 'marginBottom': '20px'}),
 
-                    create_input_group(feature_map['higher'], 'higher', [{'label': 'No', 'value': 0}, {'label': 'Yes', 'value': 1}], 1),
-                    create_input_group(feature_map['studytime'], 'studytime', [{'label': 'Low (<2h)', 'value': 1}, {'label': 'Moderate', 'value': 1}, {'label': 'High', 'value': 3}, {'label': 'Very High (>10h)', 'value': 4}], 1),
-                    create_input_group(feature_map['traveltime'], 'traveltime', [{'label': '<15 min', 'value': 1}, {'label': '15-30 min', 'value': 1}, {'label': '30-60 min', 'value': 3}, {'label': '>1 hour', 'value': 4}], 1),
-                    create_input_group(feature_map['failures'], 'failures', [{'label': str(i), 'value': i} for i in range(0, 5)], 0),
-                    create_input_group(feature_map['schoolsup'], 'schoolsup', [{'label': 'No', 'value': 0}, {'label': 'Yes', 'value': 1}], 0),
-                    create_input_group(feature_map['famsup'], 'famsup', [{'label': 'No', 'value': 0}, {'label': 'Yes', 'value': 1}], 1),
-                    create_input_group(feature_map['activities'], 'activities', [{'label': 'No', 'value': 0}, {'label': 'Yes', 'value': 1}], 1),
-                    create_input_group(feature_map['goout'], 'goout', [{'label': str(i), 'value': i} for i in range(1, 6)], 1),
-                    create_input_group(feature_map['Dalc'], 'Dalc', [{'label': str(i), 'value': i} for i in range(1, 6)], 1),
-                    create_input_group(feature_map['Walc'], 'Walc', [{'label': str(i), 'value': i} for i in range(1, 6)], 1),
-                    create_input_group(feature_map['absences'], 'absences', [{'label': str(i), 'value': i} for i in range(0, 31)], 0),
-                    create_input_group(feature_map['health'], 'health', [{'label': str(i), 'value': i} for i in range(1, 6)], 1),
+                    create_input_group(feature_map['higher'], 'higher', YES_NO, 1),
+                    create_input_group(feature_map['studytime'], 'studytime', STUDYTIME_OPTS, 1),
+                    create_input_group(feature_map['traveltime'], 'traveltime', TRAVELTIME_OPTS, 1),
+                    create_input_group(feature_map['failures'], 'failures', RANGE_0_4, 0),
+                    create_input_group(feature_map['schoolsup'], 'schoolsup', YES_NO, 0),
+                    create_input_group(feature_map['famsup'], 'famsup', YES_NO, 1),
+                    create_input_group(feature_map['activities'], 'activities', YES_NO, 1),
+                    create_input_group(feature_map['goout'], 'goout', LIKERT_1_5, 1),
+                    create_input_group(feature_map['Dalc'], 'Dalc', LIKERT_1_5, 1),
+                    create_input_group(feature_map['Walc'], 'Walc', LIKERT_1_5, 1),
+                    create_input_group(feature_map['absences'], 'absences', ABSENCES_OPTS, 0),
+                    create_input_group(feature_map['health'], 'health', LIKERT_1_5, 1),
 
                 ], style={'flex': 1, 'padding': '20px', 'minWidth': '300px', 'backgroundColor': '#f9f9f9', 'borderRadius': '10px'}),
 
@@ -310,7 +506,7 @@ app.layout = html.Div(
                     n_clicks=0,
                     style={'backgroundColor': 'green', 'color': 'white', 'padding': '15px 30px', 'borderRadius': '5px', 'fontSize': '18px', 'cursor': 'pointer', 'width': '100%', 'border': 'none'}
                 ),
-                html.Div(id='respons', style={'marginTop': '30px', 'padding': '20px', 'backgroundColor': '#e8f5e9', 'color': 'green', 'textAlign': 'center', 'fontSize': '24px', 'fontWeight': 'bold', 'borderRadius': '5px'})
+                html.Div(id='respons', children="Enter your details and click Calculate.", style={'marginTop': '30px', 'padding': '20px', 'backgroundColor': '#e8f5e9', 'color': 'green', 'textAlign': 'center', 'fontSize': '24px', 'fontWeight': 'bold', 'borderRadius': '5px'})
             ], style={'maxWidth': '600px', 'margin': '40px auto'})
 
         ], style={'padding': '40px', 'fontFamily': 'Arial, sans-serif'})
@@ -327,43 +523,41 @@ app.layout = html.Div(
 def update_graph(selected_variable: str) -> Any:
     """Updates the Exploratory Data Analysis graph based on dropdown selection.
 
-    This callback creates a copy of the main dataframe, maps the raw categorical
-    or binary values to human-readable labels (e.g., 0/1 to Female/Male), and
-    generates a Box Plot comparing the selected feature to the final grade (G3).
+    All figures are precomputed in `EDA_FIGS`, so this is a plain lookup.
 
     Args:
         selected_variable (str): The column name selected from the EDA dropdown.
 
     Returns:
-        plotly.graph_objects.Figure: A Plotly Box plot figure visualization.
+        Dict[str, Any]: The Box plot figure as a plain Plotly figure dict.
     """
-    plot_df = df.copy()
-    nice_name = feature_map.get(selected_variable, selected_variable)
+    return EDA_FIGS[selected_variable]
+#%%
 
-    # Map raw data to readable labels for specific binary/categorical columns
-    mappings = {
-        'sex': {0: 'Female', 1: 'Male'},
-        'address': {0: 'Urban', 1: 'Rural'},
-        'school': {0: 'Gabriel Pereira', 1: 'Mousinho da Silveira'},
-        'internet': {0: 'No', 1: 'Yes'},
-        'higher': {0: 'No', 1: 'Yes'}
-    }
+# Model input columns, in the order the calculator passes its values
+CALCULATOR_FIELDS: Tuple[str, ...] = (
+    'school', 'sex', 'age', 'address', 'internet', 'higher', 'Medu', 'Fedu',
+    'Mjob', 'Fjob', 'reason', 'famsup', 'traveltime', 'studytime', 'failures',
+    'schoolsup', 'activities', 'absences', 'romantic', 'goout', 'Dalc', 'Walc',
+    'health'
+)
 
-    if selected_variable in mappings:
-        plot_df[selected_variable] = plot_df[selected_variable].map(mappings[selected_variable])
 
-    # Create the visualization
-    fig = px.box(
-        plot_df,
-        x=selected_variable,
-        y='G3',
-        color=selected_variable,
-        title=f"Impact of '{nice_name}' on Final Grade",
-        labels={selected_variable: nice_name, 'G3': 'Final Grade (0-100)'}
-    )
+def _predict(key: Tuple[Any, ...]) -> float:
+    """Predicts the grade for one set of calculator inputs.
+
+    Args:
+        key (Tuple[Any, ...]): Input values ordered as in `CALCULATOR_FIELDS`.
+
+    Returns:
+        float: The predicted grade (0-100).
+    """
+    # Construct input dictionary matching model expectations
+    input_data = {field: [value] for field, value in zip(CALCULATOR_FIELDS, key)}
+
+    # Predict using the imported logic
+    return predict_grade(input_data, PREDICTOR)
 
-    return fig
-#%%
 
 @app.callback(
     Output('respons', 'children'),
@@ -390,7 +584,11 @@ def update_graph(selected_variable: str) -> Any:
     State('goout', 'value'),
     State('Dalc', 'value'),
     State('Walc', 'value'),
-    State('health', 'value')
+    State('health', 'value'),
+    prevent_initial_call=True,
+    background=True,
+    cache_args_to_ignore=[0],  # positional index of n_clicks, so the click count stays out of the cache key
+    interval=200
 )
 def calculate_grade(
     n_clicks: int,
@@ -403,8 +601,9 @@ def calculate_grade(
     """Collects inputs from the UI, formats them, and predicts the final grade.
 
     Triggered by the 'Calculate Grade' button. It aggregates all State values
-    from the Dash layout into a dictionary, which is passed to the prediction
-    logic in the `main` module.
+    from the Dash layout into a key tuple, which is passed to the prediction
+    logic in the `main` module. Runs as a background callback, and results
+    for identical inputs are served from the on-disk callback cache.
 
     Args:
         n_clicks (int): Number of times the submit button has been clicked.
@@ -434,43 +633,24 @@ def calculate_grade(
 
     Returns:
         str: A formatted string displaying the calculated grade (e.g.,
-        "Calculated Grade: 75.0%") or a prompt to enter details if the
-        button has not been clicked yet.
+        "Calculated Grade: 75.0%").
+
+    Raises:
+        PreventUpdate: If the button has not been clicked yet, leaving the
+            initial prompt from the layout in place.
     """
-    if n_clicks > 0:
-        # Construct input dictionary matching model expectations
-        input_data = {
-            'school': [school],
-            'sex': [sex],
-            'age': [age],
-            'address': [address],
-            'internet': [internet],
-            'higher': [higher],
-            'Medu': [medu],
-            'Fedu': [fedu],
-            'Mjob': [mjob],
-            'Fjob': [fjob],
-            'reason': [reason],
-            'famsup': [famsup],
-            'traveltime': [traveltime],
-            'studytime': [studytime],
-            'failures': [failures],
-            'schoolsup': [schoolsup],
-            'activities': [activities],
-            'absences': [absences],
-            'romantic': [romantic],
-            'goout': [goout],
-            'Dalc': [dalc],
-            'Walc': [walc],
-            'health': [health]
-        }
-
-        # Predict using the imported logic
-        grade = predict_grade(input_data, lin_reg, X_train.columns, scaler)
-
-        return f"Calculated Grade: {grade:.1f}%"
-
-    return "Enter your details and click Calculate."
+    if not n_clicks:
+        raise PreventUpdate
+
+    # Positional key in the same order as CALCULATOR_FIELDS
+    key = (
+        school, sex, age, address, internet, higher, medu, fedu, mjob,
+        fjob, reason, famsup, traveltime, studytime, failures, schoolsup,
+        activities, absences, romantic, goout, dalc, walc, health
+    )
+    grade = _predict(key)
+
+    return f"Calculated Grade: {grade:.1f}%"
 
 #%%
 # --- Main Execution Block ---
@@ -480,4 +660,4 @@ if __name__ == '__main__':
     Timer(1, open_browser, args=[HOST, PORT]).start()
 
     # Start the Dash server
-    app.run(debug=True, host=HOST, port=PORT)
\ No newline at end of file
+    app.run(debug=DEBUG, host=HOST, port=PORT)
\ No newline at end of file
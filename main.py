@@ -9,7 +9,11 @@ final grades (G3), and generates various Plotly visualizations to analyze the re
 and feature importance.
 """
 #%%
+import os
+import tempfile
+import numpy as np
 import pandas as pd
+from numba import njit, prange
 from sklearn.linear_model import LinearRegression
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_absolute_error, r2_score
@@ -31,8 +35,14 @@ def load_and_clean(filename: str) -> pd.DataFrame:
     - Drops intermediate grades 'G1' and 'G2' to prevent data leakage.
     - Encodes binary categorical columns (yes/no) to integers (1/0).
     - Maps specific categorical columns (sex, address, etc.) to binary values.
+      All binary columns are stored as int8.
+    - Narrows the other integer columns to int8 when their values fit.
     - Scales the target variable 'G3' to a percentage (0-100).
-    - One-hot encodes remaining categorical variables using get_dummies.
+    - One-hot encodes remaining categorical variables into int8 dummy columns
+      (named like get_dummies, e.g. 'Mjob_teacher').
+
+    The result is cached next to the CSV as '<filename>.clean.parquet' and read
+    back directly while it is newer than both the CSV and this module.
 
     Args:
         filename (str): Path to the .csv file containing student data.
@@ -40,11 +50,18 @@ def load_and_clean(filename: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: A cleaned and preprocessed dataframe ready for analysis.
     """
-    df = pd.read_csv(filename, sep=';')
-    
-    #Filter valid grades and drop intermediate period grades, these choices are explained in README
-    df = df.query('G3 > 0')
-    df = df.drop(['G1', 'G2'], axis=1)
+    cache_file = filename + '.clean.parquet'
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) > max(
+        os.path.getmtime(filename), os.path.getmtime(__file__)
+    ):
+        try:
+            return pd.read_parquet(cache_file)
+        except (OSError, ValueError):  # unreadable cache (e.g. pyarrow's ArrowInvalid): rebuild it
+            pass
+    
+    #Drop intermediate period grades (never read) and filter valid grades, these choices are explained in README
+    df = pd.read_csv(filename, sep=';', usecols=lambda col: col not in ('G1', 'G2'))
+    df = df.loc[df['G3'].to_numpy() > 0]
     
     #Standard binary mapping
     binary_yes_no = [
@@ -52,71 +69,227 @@ def load_and_clean(filename: str) -> pd.DataFrame:
         'higher', 'internet', 'romantic'
     ]
     
-    for col in binary_yes_no:
-        df[col] = df[col].replace({'no': 0, 'yes': 1})
+    # Value mapped to 1 for each binary column, everything else becomes 0
+    binary_positive = pd.Series({
+        **dict.fromkeys(binary_yes_no, 'yes'),
+        'sex': 'M',         # F -> 0
+        'address': 'R',     # U -> 0
+        'famsize': 'GT3',   # LE3 -> 0
+        'Pstatus': 'A',     # T -> 0
+        'school': 'MS'      # GP -> 0
+    })
     
-    # Specific column mapping
-    df['sex'] = df['sex'].replace({'F': 0, 'M': 1})        
-    df['address'] = df['address'].replace({'U': 0, 'R': 1}) 
-    df['famsize'] = df['famsize'].replace({'LE3': 0, 'GT3': 1}) 
-    df['Pstatus'] = df['Pstatus'].replace({'T': 0, 'A': 1}) 
-    df['school']  = df['school'].replace({'GP': 0, 'MS': 1})
+    # One vectorized comparison across all binary columns instead of a .replace per column
+    binary_cols = binary_positive.index.tolist()
+    df[binary_cols] = df[binary_cols].eq(binary_positive).astype('int8')
     
     # Convert G3 (0-20 scale) to percentage (0-100)
     df['G3'] = (df['G3'] * 100) / 20
     
+    # Narrow the remaining integer columns (age, ordinal scales, counts) to int8 when
+    # they fit, so every pass over the cleaned frame moves fewer bytes
+    int_cols = df.select_dtypes(include='int64').columns
+    int_values = df[int_cols].to_numpy()
+    int8_range = np.iinfo(np.int8)
+    if int8_range.min <= int_values.min() and int_values.max() <= int8_range.max:
+        df[int_cols] = int_values.astype(np.int8)
+    
     # Separate types for dummy encoding
     catvars = df.select_dtypes(include='object').columns.tolist()
     numvars = df.select_dtypes(exclude='object').columns.tolist()
     
-    dummyv = pd.get_dummies(df[catvars], dtype=int)
-    
-    df_clean = pd.concat([df[numvars], dummyv], axis=1)
+    # One-hot encode every categorical column, setting out[row, code] = 1 per column
+    # instead of building a Series per category
+    factorized = [pd.factorize(df[col], sort=True) for col in catvars]
+    dummy_cols = [f"{col}_{level}" for col, (_, levels) in zip(catvars, factorized) for level in levels]
+    
+    # The integer features and the dummies share one preallocated column-major block,
+    # so the frame is built from a single array without a concat/consolidation copy.
+    # G3 is the only float column and is inserted back at its position afterwards.
+    int_features = [col for col in numvars if col != 'G3']
+    block_dtype = np.result_type(np.int8, *df[int_features].dtypes)
+    block = np.zeros((len(df), len(int_features) + len(dummy_cols)), dtype=block_dtype, order='F')
+    block[:, :len(int_features)] = df[int_features].to_numpy()
+    
+    rows = np.arange(len(df))
+    offset = len(int_features)
+    for codes, levels in factorized:
+        valid = codes >= 0  # missing values get no dummy, as with get_dummies
+        block[rows[valid], offset + codes[valid]] = 1
+        offset += len(levels)
+    
+    df_clean = pd.DataFrame(block, columns=int_features + dummy_cols, index=df.index, copy=False)
+    df_clean.insert(numvars.index('G3'), 'G3', df['G3'].to_numpy())
+    
+    # Caching is best effort; a read-only or full data folder just means no cached copy.
+    # Write to a temporary file next to the cache and swap it in, so an interrupted
+    # write never leaves a partial file behind under the cache name
+    tmp_file = None
+    try:
+        fd, tmp_file = tempfile.mkstemp(
+            prefix=os.path.basename(cache_file) + '.', suffix='.tmp',
+            dir=os.path.dirname(os.path.abspath(cache_file))
+        )
+        os.close(fd)
+        df_clean.to_parquet(tmp_file)
+        os.replace(tmp_file, cache_file)
+        tmp_file = None
+    except OSError:
+        pass
+    finally:
+        if tmp_file is not None and os.path.exists(tmp_file):
+            os.remove(tmp_file)
     
     return df_clean
 
 #%%
 
-def prepare_data(filename: str, threshold: float):
+def prepare_data(df_clean: pd.DataFrame, threshold: float):
     """
-    Orchestrates the data loading, splitting, feature selection, and scaling.
+    Orchestrates the data splitting, feature selection, and scaling.
 
     Args:
-        filename (str): Path to the source CSV file.
+        df_clean (pd.DataFrame): The cleaned dataset returned by load_and_clean.
+            It is not modified.
         threshold (float): Correlation threshold for feature selection.
 
     Returns:
         tuple: Contains X_train, X_test, y_train, y_test (all scaled/processed),
                the list of selected features, and the fitted scaler object.
     """
-    df_clean = load_and_clean(filename)
-
-    X_all = df_clean.drop('G3', axis=1)
-    y_all = df_clean['G3']
-
-    # Split data
-    X_train_all, X_test_all, y_train, y_test = train_test_split(X_all, y_all, test_size=0.2, random_state=42)
+    # Work on plain ndarrays throughout; pandas objects are only rebuilt for the return value
+    feature_cols = df_clean.columns.drop('G3')
+    X_all = df_clean[feature_cols].to_numpy(dtype=np.float64)
+    y_all = df_clean['G3'].to_numpy(dtype=np.float64)
+
+    # Split data (the row labels are split alongside so the indices can be restored)
+    X_train_all, X_test_all, y_train, y_test, idx_train, idx_test = train_test_split(
+        X_all, y_all, df_clean.index.to_numpy(), test_size=0.2, random_state=42
+    )
 
     # Select features based on training data only
-    selected_features, _ = get_important_features(X_train_all, y_train, threshold=threshold)
+    selected_features, _ = get_important_features(X_train_all, y_train, threshold=threshold, columns=feature_cols)
     
-    X_train = X_train_all[selected_features]
-    X_test = X_test_all[selected_features]
+    sel_idx = feature_cols.get_indexer(selected_features)
+    X_train = X_train_all[:, sel_idx]
+    X_test = X_test_all[:, sel_idx]
 
-    # Scale the features
-    scaler = StandardScaler()
+    # Scale the features in place; the fancy-indexed slices above are fresh arrays we own
+    scaler = StandardScaler(copy=False)
     X_train_scaled = scaler.fit_transform(X_train)
     X_test_scaled = scaler.transform(X_test)
+    scaler.set_params(copy=True)  # don't let later transform() calls overwrite callers' data
     
-    # Reconstruct DataFrames to keep column names and indices
-    X_train = pd.DataFrame(X_train_scaled, columns=selected_features, index=X_train.index)
-    X_test = pd.DataFrame(X_test_scaled, columns=selected_features, index=X_test.index)
+    # Reconstruct DataFrames/Series to keep column names and indices
+    X_train = pd.DataFrame(X_train_scaled, columns=selected_features, index=idx_train)
+    X_test = pd.DataFrame(X_test_scaled, columns=selected_features, index=idx_test)
+    y_train = pd.Series(y_train, index=idx_train, name='G3')
+    y_test = pd.Series(y_test, index=idx_test, name='G3')
     
     return X_train, X_test, y_train, y_test, selected_features, scaler
 #%%
 
+# Above this many matrix entries the correlations with G3 are computed by the parallel
+# Numba kernel. Loading the compiled kernel and starting its thread pool costs a few
+# hundred ms once per process, so smaller matrices stay on the BLAS path
+PARALLEL_CORR_MIN_SIZE = 10_000_000
+
 
-def get_important_features(X_train: pd.DataFrame, y_train: pd.Series, threshold: float):
+@njit(parallel=True, fastmath={'reassoc', 'contract'}, cache=True)
+def _corr_with_target(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Computes the Pearson correlation of every column of X with y.
+
+    Each column is handled by its own thread using only scalar accumulators, so no
+    centered copy of X is allocated. Constant columns give NaN.
+
+    Args:
+        X (np.ndarray): Column-major (n_samples, n_features) feature matrix.
+            Row-major input goes through `_corr_with_target_rows` instead.
+        y (np.ndarray): Target values.
+
+    Returns:
+        np.ndarray: The correlation coefficient r of each column.
+    """
+    n, p = X.shape
+    yc = y - y.mean()
+    syy = 0.0
+    for i in range(n):
+        syy += yc[i] * yc[i]
+    
+    r = np.empty(p)
+    for j in prange(p):
+        col = X[:, j]
+        mean = 0.0
+        for i in range(n):
+            mean += col[i]
+        mean /= n
+        
+        sxx = 0.0
+        sxy = 0.0
+        for i in range(n):
+            d = col[i] - mean
+            sxx += d * d
+            sxy += d * yc[i]
+        
+        denom = np.sqrt(sxx * syy)
+        r[j] = sxy / denom if denom > 0.0 else np.nan
+    return r
+
+
+@njit(parallel=True, fastmath={'reassoc', 'contract'}, cache=True)
+def _corr_with_target_rows(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Row-major counterpart of `_corr_with_target`.
+
+    The rows are split into chunks that are streamed in memory order, each chunk
+    accumulating per-column partial sums. Only (n_chunks, n_features) partials are
+    allocated, never a copy of X. Constant columns give NaN.
+
+    Args:
+        X (np.ndarray): Row-major (n_samples, n_features) feature matrix.
+        y (np.ndarray): Target values.
+
+    Returns:
+        np.ndarray: The correlation coefficient r of each column.
+    """
+    n, p = X.shape
+    n_chunks = min(n, 256)
+    bounds = np.linspace(0, n, n_chunks + 1).astype(np.int64)
+    yc = y - y.mean()
+    syy = 0.0
+    for i in range(n):
+        syy += yc[i] * yc[i]
+    
+    # First pass: column means
+    partial_sum = np.zeros((n_chunks, p))
+    for c in prange(n_chunks):
+        for i in range(bounds[c], bounds[c + 1]):
+            for j in range(p):
+                partial_sum[c, j] += X[i, j]
+    mean = partial_sum.sum(axis=0) / n
+    
+    # Second pass: centered sums of squares and cross products with y
+    partial_sxx = np.zeros((n_chunks, p))
+    partial_sxy = np.zeros((n_chunks, p))
+    for c in prange(n_chunks):
+        for i in range(bounds[c], bounds[c + 1]):
+            yi = yc[i]
+            for j in range(p):
+                d = X[i, j] - mean[j]
+                partial_sxx[c, j] += d * d
+                partial_sxy[c, j] += d * yi
+    sxx = partial_sxx.sum(axis=0)
+    sxy = partial_sxy.sum(axis=0)
+    
+    r = np.empty(p)
+    for j in range(p):
+        denom = np.sqrt(sxx[j] * syy)
+        r[j] = sxy[j] / denom if denom > 0.0 else np.nan
+    return r
+
+
+def get_important_features(X_train, y_train, threshold: float, columns=None):
     """
     Selects features based on their Pearson correlation coefficient with the target variable G3.
     
@@ -125,24 +298,50 @@ def get_important_features(X_train: pd.DataFrame, y_train: pd.Series, threshold:
     are treated as equally important as strong positive ones.
 
     Args:
-        X_train (pd.DataFrame): The training feature set.
-        y_train (pd.Series): The training target values (G3).
+        X_train (pd.DataFrame or np.ndarray): The training feature set.
+        y_train (pd.Series or np.ndarray): The training target values (G3).
         threshold (float): The absolute correlation value required to keep a feature.
+        columns (list, optional): Feature names, required when X_train is an ndarray.
+            Defaults to X_train.columns.
 
     Returns:
         tuple: 
             - selected_features (list): List of column names that meet the threshold.
-            - correlations (pd.Series): The correlation series sorted by absolute value.
+            - correlations (pd.Series): The absolute correlation of each feature with G3,
+              sorted in descending order.
     """
     
-    temp_df = X_train.copy()
-    temp_df['G3'] = y_train
-    
-    correlations = temp_df.corr()['G3'].abs().sort_values(ascending=False)
-    selected_features = correlations[correlations > threshold].index.tolist()
-    
-    if 'G3' in selected_features:
-        selected_features.remove('G3')
+    # Only the correlation of each feature with G3 is needed, not the full matrix:
+    # r = Xc.T @ yc / sqrt(sum(Xc**2) * sum(yc**2)) on the centered data
+    if columns is None:
+        columns = X_train.columns
+    
+    Xv = np.asarray(X_train, dtype=np.float64)
+    yv = np.asarray(y_train, dtype=np.float64)
+    
+    if Xv.size >= PARALLEL_CORR_MIN_SIZE:
+        # Pick the kernel matching the memory layout; only a non-contiguous view is copied
+        yv = np.ascontiguousarray(yv)
+        if Xv.flags.f_contiguous:
+            r = _corr_with_target(Xv, yv)
+        else:
+            r = _corr_with_target_rows(np.ascontiguousarray(Xv), yv)
+    else:
+        Xc = Xv - Xv.mean(axis=0)
+        yc = yv - yv.mean()
+        
+        with np.errstate(divide='ignore', invalid='ignore'):  # constant columns give NaN, like .corr()
+            r = (Xc.T @ yc) / np.sqrt((Xc * Xc).sum(axis=0) * (yc @ yc))
+    
+    # One stable argsort on the ndarray (NaN last, as sort_values does); the features
+    # above the threshold are then simply the leading entries of that order
+    absr = np.abs(r)
+    order = np.argsort(-absr, kind='stable')
+    n_selected = np.count_nonzero(absr > threshold)
+    
+    ordered_columns = np.asarray(columns, dtype=object)[order]
+    correlations = pd.Series(absr[order], index=ordered_columns)
+    selected_features = ordered_columns[:n_selected].tolist()
         
     return selected_features, correlations
 
@@ -176,45 +375,91 @@ def train_model(X_train: pd.DataFrame, X_test: pd.DataFrame, y_train: pd.Series,
     return lin_reg, error, r2, y_test, y_pred
 #%%
 
-def predict_grade(incoming_data_dict: dict, model, training_columns: list, scaler) -> float:
+def build_predictor(model, scaler, training_columns: list) -> tuple:
     """
-    Predicts a grade for a single new student entry.
+    Precomputes everything needed to predict single student entries quickly.
 
-    Ensures the incoming data structure matches the training data by handling
-    dummy variables and reindexing missing columns with 0.
+    Since the model is linear, the scaling can be folded into its coefficients:
+    ((x - mean) / scale) @ coef + intercept == x @ (coef / scale) + bias,
+    with bias = intercept - sum(coef * mean / scale).
 
     Args:
-        incoming_data_dict (dict): Raw data for a single student.
         model (sklearn.model): The trained estimator.
-        training_columns (list): List of columns used during training (feature selection).
         scaler (StandardScaler): The scaler fitted on training data.
+        training_columns (list): List of columns used during training (feature selection).
 
     Returns:
-        float: The predicted grade, clamped between 0 and 100.
+        tuple: 
+            - weights (np.ndarray): Coefficients applying directly to unscaled features.
+            - bias (float): The matching intercept.
+            - col_index (dict): Maps each training column name to its position.
     """
-    df_new = pd.DataFrame(incoming_data_dict)
+    weights = model.coef_ / scaler.scale_
+    bias = float(model.intercept_ - (model.coef_ * scaler.mean_ / scaler.scale_).sum())
+    col_index = {col: i for i, col in enumerate(training_columns)}
     
-    # Handle categorical variables
-    cat_cols = df_new.select_dtypes(include='object').columns
-    if len(cat_cols) > 0:
-        df_dummies = pd.get_dummies(df_new[cat_cols], dtype=int)
-        df_new = df_new.drop(cat_cols, axis=1)
-        df_new = pd.concat([df_new, df_dummies], axis=1)
+    return weights, bias, col_index
+
+
+# Compiled eagerly for its one signature at import, so processes forked from an importer
+# (such as the dashboard's background callback workers) inherit the machine code
+@njit('float64(float64[::1], float64[::1], float64)', cache=True)
+def _linear_predict(x: np.ndarray, weights: np.ndarray, bias: float) -> float:
+    """
+    Applies the folded linear model to a single raw feature vector.
+
+    Args:
+        x (np.ndarray): Raw feature vector, ordered like the training columns.
+        weights (np.ndarray): Coefficients from `build_predictor`.
+        bias (float): Intercept from `build_predictor`.
+
+    Returns:
+        float: The unclamped prediction.
+    """
+    total = bias
+    for i in range(x.shape[0]):
+        total += x[i] * weights[i]
+    return total
+
+
+def predict_grade(incoming_data_dict: dict, predictor: tuple) -> float:
+    """
+    Predicts a grade for a single new student entry.
+
+    Ensures the incoming data structure matches the training data by writing
+    numeric values and one-hot encoded categories straight into a feature
+    vector ordered like the training columns. Columns missing from the input
+    stay 0. No pandas or sklearn code runs per call.
+
+    Args:
+        incoming_data_dict (dict): Raw data for a single student.
+        predictor (tuple): The (weights, bias, col_index) tuple from `build_predictor`.
+
+    Returns:
+        float: The predicted grade, clamped between 0 and 100.
+    """
+    weights, bias, col_index = predictor
+    x = np.zeros(len(col_index))
+
+    for col, values in incoming_data_dict.items():
+        value = values[0]
+        if value is None:
+            continue  # cleared inputs count as missing and stay 0
+        if isinstance(value, str):
+            # Categorical values map onto their dummy column, e.g. Mjob_teacher
+            idx = col_index.get(f"{col}_{value}")
+            if idx is not None:
+                x[idx] = 1.0
+        else:
+            idx = col_index.get(col)
+            if idx is not None:
+                x[idx] = value
 
-    # Align columns with training data (fill missing dummies with 0)
-    df_final = df_new.reindex(columns=training_columns, fill_value=0)
-    
-    # Scale input
-    df_final_scaled = scaler.transform(df_final)
-    
     # Predict
-    model_guess = model.predict(df_final_scaled)[0]
+    model_guess = _linear_predict(x, weights, bias)
     
     # Clamp result
-    if model_guess < 0: return 0.0
-    if model_guess > 100: return 100.0
-    
-    return model_guess
+    return float(min(100.0, max(0.0, model_guess)))
 
 
 # %% Visualization Functions
@@ -230,17 +475,25 @@ def accuracy_fig(y_test: pd.Series, y_pred) -> go.Figure:
     Returns:
         plotly.graph_objects.Figure: The scatter plot object.
     """
-    fig_model_accuracy = px.scatter(
-        x=y_test, 
-        y=y_pred,
-        labels={'x': "Actual grade", 'y': 'Grade according to model'}, 
-        title="Plot over the method's accuracy", 
-        color_discrete_sequence=['green']
-    )
-    # Add a reference line for perfect prediction
-    fig_model_accuracy.add_shape(
-        type="line", line=dict(dash='dash', color='red'),
-        x0=0, y0=0, x1=100, y1=100
+    # Built directly with graph_objects (WebGL markers), layout and shape in one go
+    fig_model_accuracy = go.Figure(
+        go.Scattergl(
+            x=np.asarray(y_test), 
+            y=np.asarray(y_pred),
+            mode='markers',
+            marker=dict(color='green'),
+            hovertemplate="Actual grade=%{x}<br>Grade according to model=%{y}<extra></extra>"
+        ),
+        layout=dict(
+            title="Plot over the method's accuracy",
+            xaxis_title="Actual grade",
+            yaxis_title='Grade according to model',
+            # Add a reference line for perfect prediction
+            shapes=[dict(
+                type="line", line=dict(dash='dash', color='red'),
+                x0=0, y0=0, x1=100, y1=100
+            )]
+        )
     )
     
     return fig_model_accuracy
@@ -256,15 +509,20 @@ def grade_fig(df: pd.DataFrame) -> go.Figure:
     Returns:
         go.Figure: A Plotly histogram showing the grade distribution.
     """
-    fig_g3_dist = px.histogram(
-        df, 
-        x='G3', 
-        nbins=20, 
-        title='Distribution of grades (G3)',
-        labels={'G3': 'Grade (%)', 'count': 'Number of students'},
-        color_discrete_sequence=['green'] 
+    fig_g3_dist = go.Figure(
+        go.Histogram(
+            x=df['G3'].to_numpy(), 
+            nbinsx=20, 
+            marker=dict(color='green'),
+            hovertemplate="Grade (%)=%{x}<br>count=%{y}<extra></extra>"
+        ),
+        layout=dict(
+            title='Distribution of grades (G3)',
+            xaxis_title='Grade (%)',
+            yaxis_title="Number of students",
+            bargap=0.1
         )
-    fig_g3_dist.update_layout(bargap=0.1, yaxis_title="Number of students")
+    )
     
     return fig_g3_dist
 
@@ -281,8 +539,9 @@ def feature_fig(X: pd.DataFrame, model: LinearRegression) -> go.Figure:
     Returns:
         go.Figure: A bar chart sorted by the absolute impact of features.
     """
-    coef_df = pd.DataFrame({'Feature': X.columns, 'Impact': model.coef_})
-    coef_df = coef_df.sort_values(by='Impact', ascending=False)
+    # Order the coefficients with one argsort so the frame is built already sorted
+    order = np.argsort(-model.coef_, kind='stable')
+    coef_df = pd.DataFrame({'Feature': X.columns.to_numpy()[order], 'Impact': model.coef_[order]})
     
     fig_feature = px.bar(
         coef_df, 
@@ -318,10 +577,13 @@ def heatmap_fig(threshold: float, selected_features: list, df_clean: pd.DataFram
     """
 
     heatmap_cols = selected_features + ['G3'] 
-    corr_matrix = df_clean[heatmap_cols].corr().round(2)
+    values = df_clean[heatmap_cols].to_numpy(dtype=np.float64)
+    corr = np.corrcoef(values, rowvar=False).round(2)
 
     # Mask low correlations
-    corr_matrix[corr_matrix.abs() < threshold] = 0
+    corr[np.abs(corr) < threshold] = 0.0
+
+    corr_matrix = pd.DataFrame(corr, index=heatmap_cols, columns=heatmap_cols)
 
     fig_corr = px.imshow(
         corr_matrix,
@@ -348,14 +610,15 @@ def box_fig(df: pd.DataFrame, x_col: str = 'sex') -> go.Figure:
     Returns:
         plotly.graph_objects.Figure: The box plot.
     """
-    plot_df = df.copy()
-
+    # Only the two plotted columns are needed, so take them as arrays rather than copying df
+    x_values = df[x_col].to_numpy()
+    
     # Map binary 0/1 back to No/Yes for better visualization labels
-    if plot_df[x_col].dtype in ['int64', 'float64'] and plot_df[x_col].nunique() == 2:
-        plot_df[x_col] = plot_df[x_col].map({0: 'No', 1: 'Yes'})
+    if pd.api.types.is_numeric_dtype(x_values) and df[x_col].nunique() == 2:
+        x_values = np.where(x_values == 1, 'Yes', 'No')
 
     fig_boxplot = px.box(
-        plot_df, 
+        {x_col: x_values, 'G3': df['G3'].to_numpy()}, 
         x=x_col, 
         y='G3',
         title=f"How does '{x_col}' affect Grades?",
@@ -380,7 +643,7 @@ if __name__ == '__main__':
     # Run pipeline
     print("Loading and preparing data...")
     df_full = load_and_clean(data_file)
-    X_train, X_test, y_train, y_test, selected_features, scaler = prepare_data(data_file, correlation_threshold)
+    X_train, X_test, y_train, y_test, selected_features, scaler = prepare_data(df_full, correlation_threshold)
     
     print(f"Training model with {len(selected_features)} selected features...")
     lin_reg, error, r2, y_test, y_pred = train_model(X_train, X_test, y_train, y_test)